@@ -2,23 +2,52 @@
 import sys
 import os
 import cv2
+import numpy as np
+import queue
+import subprocess
+import threading
 import traceback
+from collections import deque
 from functools import partial
 
+# Optional PyAV backend for hardware-friendly decode + fast seeking.
+# Falls back to cv2.VideoCapture when PyAV is not installed.
+try:
+    import av
+except Exception:
+    av = None
+
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QPushButton, QFileDialog,
-    QVBoxLayout, QHBoxLayout, QTextEdit, QMessageBox, QSlider,
+    QVBoxLayout, QHBoxLayout, QMessageBox, QSlider,
     QFrame, QLineEdit, QGridLayout, QProgressBar, QListWidget,
-    QListWidgetItem, QSpinBox
+    QListWidgetItem, QSpinBox, QDialog, QPlainTextEdit
+)
+from PyQt5.QtCore import (
+    Qt, QObject, QRunnable, QThread, QThreadPool, QTimer, QUrl,
+    pyqtSignal, QSize
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize
 from PyQt5.QtGui import QImage, QPixmap, QFont, QKeySequence, QIcon
 
+try:
+    from PyQt5 import sip
+except ImportError:
+    import sip
+
+# Hardware-accelerated highlight playback; PyQt5 ships QtMultimedia but
+# it can be missing on stripped-down installs.
+try:
+    from PyQt5.QtMultimedia import QMediaContent, QMediaPlayer
+    from PyQt5.QtMultimediaWidgets import QVideoWidget
+except Exception:
+    QMediaPlayer = None
+
 # Try import CricketEngine. If this fails, show a friendly error later.
 try:
-    from engine.engine import CricketEngine
+    from engine.engine import CricketEngine, Metrics
 except Exception as e:
     CricketEngine = None
+    Metrics = None
     import_error = e
 
 
@@ -26,8 +55,7 @@ except Exception as e:
 # VideoWorker (background)
 # ---------------------------
 class VideoWorker(QThread):
-    frame_signal = pyqtSignal(QImage)        # updated annotated frame
-    metric_signal = pyqtSignal(dict)         # updated metrics + frame_id
+    metric_signal = pyqtSignal(object)       # Metrics namedtuple per frame
     finished_signal = pyqtSignal()           # finished processing
     error_signal = pyqtSignal(str)           # error message
 
@@ -43,7 +71,286 @@ class VideoWorker(QThread):
         self.engine = None
         self.cap = None
 
+        # PyAV decode state (preferred backend when available)
+        self._container = None
+        self._stream = None
+        self._decoder = None
+        self._frame_rate = float(fps)
+        self._seek_frame = None
+        self._frame_index = 0
+        self._grab_skip = 0
+        self._batch_size = 4
+        self._container_lock = threading.Lock()
+
+        # "latest frame wins" display buffer, polled by a GUI timer
+        self._frame_lock = threading.Lock()
+        self._latest_qimg = None
+        self._frame_serial = 0
+
+        # display target size; scaling happens here (vectorized cv2
+        # resize) instead of QPixmap.scaled on the GUI thread
+        self._display_size = None
+
+        # triple-buffered output: the emitter only ever writes the slot
+        # that is neither the newest published frame nor the one the
+        # GUI last took, so the ndarray behind the QImage being painted
+        # is never overwritten — still no per-frame allocation
+        self._out_bufs = None
+        self._latest_buf = -1
+        self._display_buf = -1
+
+    def set_display_size(self, width, height):
+        """Tell the worker what size the video label currently is."""
+        if width > 0 and height > 0:
+            self._display_size = (int(width), int(height))
+
+    # -------------------------
+    # Decode backends
+    # -------------------------
+    def _open_source(self):
+        """Open the video via PyAV if available, else cv2.VideoCapture."""
+        if av is not None:
+            try:
+                self._container = av.open(self.video_path)
+                self._stream = self._container.streams.video[0]
+                # let libav use slice/frame threading for decode
+                self._stream.thread_type = "AUTO"
+                if self._stream.average_rate:
+                    self._frame_rate = float(self._stream.average_rate)
+                self._decoder = self._container.decode(self._stream)
+                return
+            except Exception:
+                self._container = None
+                self._stream = None
+                self._decoder = None
+
+        self.cap = cv2.VideoCapture(self.video_path)
+        if not self.cap.isOpened():
+            raise RuntimeError("Could not open video file.")
+
+        # keep the demuxer prefetch buffer minimal for low latency
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+        # When the source runs faster than the display rate, skip the
+        # extra frames with grab() (no YUV->BGR conversion) and only
+        # retrieve() the frames the engine actually consumes.
+        src_fps = self.cap.get(cv2.CAP_PROP_FPS) or 0
+        if src_fps > 0:
+            self._frame_rate = float(src_fps)
+            self._grab_skip = max(0, int(src_fps) // max(1, self._fps) - 1)
+        else:
+            self._grab_skip = 0
+
+    def _read_frame(self):
+        """Return the next BGR frame, or None at end of stream."""
+        if self._container is not None:
+            with self._container_lock:
+                seek_to = self._seek_frame
+                self._seek_frame = None
+
+                if seek_to is not None:
+                    # keyframe seek, then decode forward to the exact frame
+                    ts = int(seek_to / self._frame_rate * av.time_base)
+                    self._container.seek(ts, any_frame=False, backward=True)
+                    self._decoder = self._container.decode(self._stream)
+                    target_time = seek_to / self._frame_rate
+                    av_frame = None
+                    for cand in self._decoder:
+                        if cand.time is None or cand.time >= target_time:
+                            av_frame = cand
+                            break
+                    self._frame_index = seek_to
+                else:
+                    av_frame = next(self._decoder, None)
+
+            if av_frame is None:
+                return None
+            return av_frame.to_ndarray(format="bgr24")
+
+        with self._container_lock:
+            seek_to = self._seek_frame
+            self._seek_frame = None
+        if seek_to is not None:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, seek_to)
+            self._frame_index = seek_to
+
+        for _ in range(self._grab_skip):
+            if not self.cap.grab():
+                return None
+            self._frame_index += 1
+        if not self.cap.grab():
+            return None
+        ret, frame = self.cap.retrieve()
+        return frame if ret else None
+
+    def _close_source(self):
+        try:
+            if self._container is not None:
+                self._container.close()
+            if self.cap is not None:
+                self.cap.release()
+        except Exception:
+            pass
+
+    # -------------------------
+    # Pipeline stages
+    # -------------------------
+    def _put_stoppable(self, q, item):
+        """Blocking put that still honours stop()."""
+        while self.running:
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _reader_loop(self, read_q):
+        """Stage 1: decode frames into the bounded read queue."""
+        try:
+            while self.running:
+                if self.paused:
+                    self.msleep(50)
+                    continue
+                frame = self._read_frame()
+                if frame is None:
+                    break
+                frame_id = self._frame_index
+                self._frame_index += 1
+                if not self._put_stoppable(read_q, (frame, frame_id)):
+                    return
+        finally:
+            self._put_stoppable(read_q, None)
+
+    def _emit_loop(self, emit_q):
+        """Stage 3: pack QImages and emit signals to the GUI."""
+        try:
+            self._emit_frames(emit_q)
+        except Exception as e:
+            # an emitter failure must not strand the producer on a
+            # full queue — report it, then keep draining until the
+            # run winds down (same stalled-stage fix as run_video)
+            tb = traceback.format_exc()
+            self.error_signal.emit(f"Emitter error: {e}\n{tb}")
+            while True:
+                try:
+                    item = emit_q.get(timeout=0.1)
+                except queue.Empty:
+                    if not self.running:
+                        break
+                    continue
+                if item is None:
+                    break
+
+    def _emit_frames(self, emit_q):
+        while True:
+            try:
+                item = emit_q.get(timeout=0.1)
+            except queue.Empty:
+                if not self.running:
+                    break
+                continue
+            if item is None:
+                break
+            annotated, data = item
+
+            # scale to the label size off the GUI thread, keeping aspect
+            display = self._display_size
+            h, w = annotated.shape[:2]
+            scale = 1.0
+            if display is not None:
+                scale = min(display[0] / w, display[1] / h)
+            if scale < 1.0:
+                dst_shape = (max(1, int(h * scale)), max(1, int(w * scale)), 3)
+            else:
+                dst_shape = annotated.shape
+
+            # reuse a rotating set of output buffers instead of
+            # allocating a fresh frame-sized array every iteration
+            if self._out_bufs is None or self._out_bufs[0].shape != dst_shape:
+                self._out_bufs = tuple(
+                    np.empty(dst_shape, dtype=annotated.dtype)
+                    for _ in range(3)
+                )
+                with self._frame_lock:
+                    self._latest_qimg = None
+                    self._latest_buf = -1
+                    self._display_buf = -1
+
+            # write the slot the GUI can't be looking at
+            with self._frame_lock:
+                busy = (self._latest_buf, self._display_buf)
+            idx = next(i for i in range(3) if i not in busy)
+            out = self._out_bufs[idx]
+            if scale < 1.0:
+                cv2.resize(annotated, (dst_shape[1], dst_shape[0]),
+                           dst=out, interpolation=cv2.INTER_AREA)
+            else:
+                np.copyto(out, annotated)
+
+            # wrap the BGR frame directly; Format_BGR888 avoids a full
+            # channel-swap pass over the frame every iteration.
+            # sip.voidptr hands Qt a raw uchar* over the persistent
+            # ping-pong buffer, guaranteeing zero-copy construction.
+            h, w, ch = out.shape
+            bytes_per_line = ch * w
+            ptr = sip.voidptr(out.ctypes.data)
+            ptr.setsize(out.nbytes)
+            qt_img = QImage(ptr, w, h, bytes_per_line, QImage.Format_BGR888)
+            # QImage does not copy: keep the ndarray alive alongside it
+            qt_img.ndarray_ref = out
+
+            # publish for the GUI-side display timer; the newest frame
+            # simply replaces any frame the GUI did not get to paint
+            with self._frame_lock:
+                self._latest_qimg = qt_img
+                self._latest_buf = idx
+                self._frame_serial += 1
+
+            self.metric_signal.emit(data)
+
+    def latest_qimage(self):
+        """Return (serial, QImage) of the newest processed frame."""
+        with self._frame_lock:
+            # claim the buffer so the emitter rotates around it while
+            # the GUI copies the QImage into a pixmap
+            self._display_buf = self._latest_buf
+            return self._frame_serial, self._latest_qimg
+
+    def _set_thread_affinity(self):
+        """Keep the worker off the GUI thread's core where possible.
+
+        On Linux the lowest-numbered CPU is left to the GUI/event loop;
+        on Windows the same is done via the thread affinity mask. Both
+        are best-effort — a single-core box keeps the full mask.
+        """
+        try:
+            if hasattr(os, "sched_setaffinity"):
+                cpus = os.sched_getaffinity(0)
+                if len(cpus) > 1:
+                    os.sched_setaffinity(0, cpus - {min(cpus)})
+            elif sys.platform.startswith("win"):
+                import ctypes
+                kernel32 = ctypes.windll.kernel32
+                mask = ctypes.c_size_t()
+                proc_mask = ctypes.c_size_t()
+                if kernel32.GetProcessAffinityMask(
+                        kernel32.GetCurrentProcess(),
+                        ctypes.byref(mask), ctypes.byref(proc_mask)):
+                    worker_mask = mask.value & (mask.value - 1)  # drop lowest CPU
+                    if worker_mask:
+                        kernel32.SetThreadAffinityMask(
+                            kernel32.GetCurrentThread(), worker_mask)
+        except Exception:
+            pass
+
     def run(self):
+        # processing shouldn't be preempted by GUI repaints
+        self.setPriority(QThread.HighPriority)
+        self._set_thread_affinity()
+
+        emit_q = None
+        emitter = None
         try:
             if CricketEngine is None:
                 raise RuntimeError(f"Failed to import CricketEngine: {import_error}")
@@ -56,66 +363,98 @@ class VideoWorker(QThread):
                 except Exception:
                     self.engine.pose_engine.target_id = self._target_id
 
-            self.cap = cv2.VideoCapture(self.video_path)
-            if not self.cap.isOpened():
-                raise RuntimeError("Could not open video file.")
+            self._open_source()
 
             self.running = True
-            frame_id = 0
-            frame_delay_ms = int(max(1, round(1000 / max(1, self._fps))))
-
-            while self.running:
-                if self.paused:
-                    self.msleep(50)
+            self._frame_index = 0
+
+            # Stage 2 (this thread) keeps single-threaded access to the
+            # stateful CricketEngine; decode and emit overlap around it.
+            read_q = queue.Queue(maxsize=4)
+            emit_q = queue.Queue(maxsize=4)
+            reader = threading.Thread(target=self._reader_loop, args=(read_q,), daemon=True)
+            emitter = threading.Thread(target=self._emit_loop, args=(emit_q,), daemon=True)
+            reader.start()
+            emitter.start()
+
+            eof = False
+            while self.running and not eof:
+                try:
+                    item = read_q.get(timeout=0.1)
+                except queue.Empty:
                     continue
-
-                ret, frame = self.cap.read()
-                if not ret:
+                if item is None:
                     break
 
+                # gather a small tile of already-decoded frames so the
+                # engine is driven in batches instead of per frame
+                tile = [item]
+                while len(tile) < self._batch_size:
+                    try:
+                        nxt = read_q.get_nowait()
+                    except queue.Empty:
+                        break
+                    if nxt is None:
+                        eof = True
+                        break
+                    tile.append(nxt)
+
+                frames = [frame for frame, _ in tile]
+                frame_ids = [frame_id for _, frame_id in tile]
                 try:
-                    annotated, data = self.engine.process_frame(frame, frame_id)
+                    results = self.engine.process_batch(frames, frame_ids)
                 except Exception as e:
                     # forward engine errors but continue
                     tb = traceback.format_exc()
                     self.error_signal.emit(f"Engine error: {e}\n{tb}")
-                    annotated = frame.copy()
-                    data = {
-                        "bat_speed": 0,
-                        "arm_speed": 0,
-                        "elbow": 0,
-                        "knee": 0,
-                        "weight": "Neutral",
-                        "track_id": "N/A",
-                        "feedback": "Processing error",
-                        "frame_id": frame_id
-                    }
-
-                # convert BGR->RGB and pack into QImage
-                rgb = cv2.cvtColor(annotated, cv2.COLOR_BGR2RGB)
-                h, w, ch = rgb.shape
-                bytes_per_line = ch * w
-                qt_img = QImage(rgb.data, w, h, bytes_per_line, QImage.Format_RGB888)
-
-                # include frame_id in data for syncing UI/timeline
-                data["frame_id"] = frame_id
-
-                self.frame_signal.emit(qt_img)
-                self.metric_signal.emit(data)
-
-                frame_id += 1
-                self.msleep(frame_delay_ms)
+                    results = [
+                        (frame.copy(), Metrics(
+                            frame_id=frame_id,
+                            shot=0,
+                            phase="Idle",
+                            track_id="N/A",
+                            weight="Neutral",
+                            elbow=0,
+                            knee=0,
+                            bat_speed=0,
+                            ball_speed=0,
+                            arm_speed=0,
+                            feedback="Processing error",
+                            highlight=None
+                        ))
+                        for frame, frame_id in tile
+                    ]
+
+                stopped = False
+                for annotated, data in results:
+                    if not self._put_stoppable(emit_q, (annotated, data)):
+                        stopped = True
+                        break
+                if stopped:
+                    break
 
         except Exception as e:
             tb = traceback.format_exc()
             self.error_signal.emit(f"Worker error: {e}\n{tb}")
         finally:
-            try:
-                if self.cap is not None:
-                    self.cap.release()
-            except Exception:
-                pass
             self.running = False
+            if emit_q is not None:
+                # bounded put: the emitter also exits on running=False,
+                # so give up rather than hang if the queue stays full
+                try:
+                    emit_q.put(None, timeout=1.0)
+                except queue.Full:
+                    pass
+            if emitter is not None:
+                emitter.join()
+            if self.engine is not None:
+                # flush the CSV tail and finish pending highlight
+                # encodes before reporting the run as done
+                try:
+                    self.engine.close()
+                except Exception:
+                    pass
+            self._close_source()
             self.finished_signal.emit()
 
     def pause(self):
@@ -131,8 +470,10 @@ class VideoWorker(QThread):
         self.wait()
 
     def seek(self, frame_no):
-        if self.cap:
-            self.cap.set(cv2.CAP_PROP_POS_FRAMES, max(0, int(frame_no)))
+        # "latest value wins": the decode loop applies the most recent
+        # target between frames, so rapid drags collapse into one seek
+        with self._container_lock:
+            self._seek_frame = max(0, int(frame_no))
 
 
 # ---------------------------
@@ -142,18 +483,98 @@ def ensure_dir(path):
     os.makedirs(path, exist_ok=True)
 
 
-def qpixmap_from_image_path(path, max_size=(320, 180)):
-    cap = cv2.VideoCapture(path)
-    ret, frame = cap.read()
-    cap.release()
-    if not ret:
+# extensions accepted as highlight clips (lowercase, no dot)
+HIGHLIGHT_EXTS = {"mp4", "avi", "mov"}
+
+
+def thumb_cache_path(video_path):
+    """Disk-side thumbnail cache file for a highlight video."""
+    return f"{video_path}.thumb.png"
+
+
+def thumb_fast(path, size):
+    """
+    Grab one scaled frame with a single ffmpeg invocation.
+
+    `-ss` before `-i` does a keyframe seek and decodes exactly one
+    frame — much cheaper than a full VideoCapture open/decode/release
+    cycle per thumbnail. Returns a BGR ndarray or None when ffmpeg is
+    unavailable or the file has no frame at ~1s.
+    """
+    try:
+        out = subprocess.run(
+            [
+                "ffmpeg", "-ss", "1", "-i", path, "-frames:v", "1",
+                # fit inside the tile without stretching, then pad to
+                # the exact size so every thumbnail is uniform
+                "-vf", (
+                    f"scale={size[0]}:{size[1]}:force_original_aspect_ratio=decrease,"
+                    f"pad={size[0]}:{size[1]}:(ow-iw)/2:(oh-ih)/2"
+                ),
+                "-f", "image2pipe", "-vcodec", "mjpeg", "-"
+            ],
+            capture_output=True, check=True
+        ).stdout
+        if not out:
+            return None
+        return cv2.imdecode(np.frombuffer(out, np.uint8), cv2.IMREAD_COLOR)
+    except Exception:
         return None
-    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    h, w, ch = rgb.shape
-    bytes_per_line = ch * w
-    img = QImage(rgb.data, w, h, bytes_per_line, QImage.Format_RGB888)
-    pix = QPixmap.fromImage(img)
-    return pix.scaled(*max_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+# ---------------------------
+# Thumbnail worker (off the GUI thread)
+# ---------------------------
+class _ThumbSignals(QObject):
+    done = pyqtSignal(str, str)  # (video path, thumbnail path)
+
+
+class ThumbnailWorker(QRunnable):
+    """Decode one frame of a highlight and cache it as a PNG."""
+
+    def __init__(self, video_path, cache_path, size=(240, 140)):
+        super().__init__()
+        self.video_path = video_path
+        self.cache_path = cache_path
+        self.size = size
+        self.signals = _ThumbSignals()
+
+    def run(self):
+        # fast path: one ffmpeg keyframe seek, one decoded frame
+        small = thumb_fast(self.video_path, self.size)
+
+        if small is None:
+            # fall back to OpenCV when ffmpeg is not on PATH
+            cap = cv2.VideoCapture(self.video_path)
+            if not cap.isOpened():
+                return
+            # seek ~1s in to avoid black/keyframe intros on short clips
+            cap.set(cv2.CAP_PROP_POS_MSEC, 1000)
+            ret, frame = cap.read()
+            if not ret:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                ret, frame = cap.read()
+            cap.release()
+            if not ret:
+                return
+            # same fit-and-pad as the ffmpeg path: keep the aspect
+            # ratio, letterbox to the tile size
+            h, w = frame.shape[:2]
+            scale = min(self.size[0] / w, self.size[1] / h)
+            new_w = max(1, int(w * scale))
+            new_h = max(1, int(h * scale))
+            small = cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_AREA)
+            pad_x = self.size[0] - new_w
+            pad_y = self.size[1] - new_h
+            small = cv2.copyMakeBorder(
+                small,
+                pad_y // 2, pad_y - pad_y // 2,
+                pad_x // 2, pad_x - pad_x // 2,
+                cv2.BORDER_CONSTANT
+            )
+
+        cv2.imwrite(self.cache_path, small)
+        self.signals.done.emit(self.video_path, self.cache_path)
 
 
 # ---------------------------
@@ -174,6 +595,43 @@ class CricketAIApp(QWidget):
         ensure_dir(self.highlights_dir)
         self.csv_path = "cricket_analysis.csv"  # default from CSVLogger
 
+        # thumbnail generation happens off the GUI thread
+        self._thumb_pool = QThreadPool.globalInstance()
+        self._thumb_buttons = {}
+        self._highlights_mtime_ns = None
+
+        # repaint timer: pulls the newest worker frame at ~30 Hz instead
+        # of painting every decoded frame
+        self._display_timer = QTimer(self)
+        self._display_timer.setInterval(33)
+        self._display_timer.timeout.connect(self._paint_latest)
+        self._painted_serial = 0
+
+        # coach feed backing store: per-frame messages land in this ring
+        # and the list widget is refreshed at most 5x per second
+        self._coach_ring = deque(maxlen=20)
+        self._coach_dirty = False
+        self._last_coach_msg = None
+        self._coach_timer = QTimer(self)
+        self._coach_timer.setInterval(200)
+        self._coach_timer.timeout.connect(self._refresh_coach_list)
+        self._coach_timer.start()
+
+        # batched activity log: messages queue up here and are flushed
+        # into the text widget in one append per timer tick
+        self._log_queue = deque(maxlen=500)
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start()
+
+        # debounced timeline updates (one setValue per 50 ms, not per frame)
+        self._pending_timeline_val = None
+        self._timeline_timer = QTimer(self)
+        self._timeline_timer.setInterval(50)
+        self._timeline_timer.setSingleShot(True)
+        self._timeline_timer.timeout.connect(self._apply_timeline_value)
+
         self.init_ui()
         self.install_shortcuts()
 
@@ -191,7 +649,7 @@ class CricketAIApp(QWidget):
             QFrame.card { background-color: #0f2330; border-radius: 10px; padding: 12px; }
             QLabel.metric { font-size: 28px; font-weight: 700; color: #dff3ff; }
             QLabel.small { color: #9fb4c8; }
-            QTextEdit { background-color: #071021; color: #dbeefc; border-radius: 8px; padding: 8px; }
+            QPlainTextEdit { background-color: #071021; color: #dbeefc; border-radius: 8px; padding: 8px; }
             QSlider::groove:horizontal { height: 8px; background: #122733; border-radius: 4px; }
             QSlider::handle:horizontal { background: #1f6feb; width: 14px; border-radius: 7px; margin: -3px 0; }
             QListWidget { background-color: #071021; border-radius: 8px; }
@@ -388,8 +846,9 @@ class CricketAIApp(QWidget):
         logs_frame.setProperty("class", "card")
         logs_layout = QVBoxLayout(logs_frame)
         logs_layout.addWidget(QLabel("Activity Log"))
-        self.log_box = QTextEdit()
+        self.log_box = QPlainTextEdit()
         self.log_box.setReadOnly(True)
+        self.log_box.setMaximumBlockCount(500)  # built-in ring buffer
         self.log_box.setFixedHeight(160)
         logs_layout.addWidget(self.log_box)
         right_panel.addWidget(logs_frame)
@@ -404,7 +863,7 @@ class CricketAIApp(QWidget):
         self.btn_open_highlights.clicked.connect(self.open_highlights)
         self.btn_export_csv.clicked.connect(self.export_csv)
         self.chk_coach.clicked.connect(self.toggle_coach)
-        self.btn_clear_coach.clicked.connect(self.coach_list.clear)
+        self.btn_clear_coach.clicked.connect(self.clear_coach)
         self.btn_copy_coach.clicked.connect(self.copy_coach_to_clipboard)
 
         self.timeline.sliderReleased.connect(self.on_seek)
@@ -461,12 +920,14 @@ class CricketAIApp(QWidget):
         tid = self.target_input.text().strip() or None
 
         self.worker = VideoWorker(self.video_path, fps=fps, target_id=tid)
-        self.worker.frame_signal.connect(self.update_video)
         self.worker.metric_signal.connect(self.update_metrics)
         self.worker.finished_signal.connect(self.on_finished)
         self.worker.error_signal.connect(self.on_worker_error)
 
+        self.worker.set_display_size(self.video_label.width(), self.video_label.height())
         self.worker.start()
+        self._painted_serial = 0
+        self._display_timer.start()
         self.status_label.setText("Status: Running")
         self.log("Analysis started")
 
@@ -530,66 +991,101 @@ class CricketAIApp(QWidget):
             self.chk_coach.setText("Toggle Coach: OFF")
             self.log("Coach: OFF")
 
+    def clear_coach(self):
+        self._coach_ring.clear()
+        self._coach_dirty = False
+        self._last_coach_msg = None
+        self.coach_list.clear()
+
+    def _refresh_coach_list(self):
+        if not self._coach_dirty:
+            return
+        self._coach_dirty = False
+        self.coach_list.clear()
+        self.coach_list.addItems(list(self._coach_ring))
+        self.coach_list.scrollToBottom()
+
     def copy_coach_to_clipboard(self):
-        text = "\n".join(self.coach_list.item(i).text() for i in range(self.coach_list.count()))
+        text = "\n".join(self._coach_ring)
         QApplication.clipboard().setText(text)
         self.log("Coach feed copied to clipboard")
 
     # -------------------------
     # UI Updaters (called from worker thread via signals)
     # -------------------------
+    def _paint_latest(self):
+        if not self.worker:
+            return
+        serial, qt_img = self.worker.latest_qimage()
+        if qt_img is None or serial == self._painted_serial:
+            return
+        self._painted_serial = serial
+        self.update_video(qt_img)
+
     def update_video(self, qt_img):
-        pix = QPixmap.fromImage(qt_img)
-        self.video_label.setPixmap(pix.scaled(self.video_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        # frames arrive pre-scaled from the worker; no per-frame
+        # SmoothTransformation resize on the GUI thread
+        self.video_label.setPixmap(QPixmap.fromImage(qt_img))
+
+    def resizeEvent(self, event):
+        if self.worker:
+            self.worker.set_display_size(self.video_label.width(), self.video_label.height())
+        super().resizeEvent(event)
 
     def update_metrics(self, data):
-        # frame sync
-        fid = data.get("frame_id")
-        if fid is not None:
-            # block signals while setting value to avoid triggering events
-            self.timeline.blockSignals(True)
-            self.timeline.setValue(int(fid))
-            self.timeline.blockSignals(False)
+        # data is the engine's Metrics namedtuple: one attribute read
+        # per field instead of a dict hash lookup each
+        # frame sync — debounced: setValue runs the style and repaints,
+        # so batch per-frame updates through a short single-shot timer
+        if data.frame_id is not None:
+            self._pending_timeline_val = int(data.frame_id)
+            if not self._timeline_timer.isActive():
+                self._timeline_timer.start()
 
         # update overlay quick metrics
-        bat = data.get("bat_speed", "--")
-        arm = data.get("arm_speed", "--")
+        bat = data.bat_speed
+        arm = data.arm_speed
         self.overlay_bat.setText(f"Bat: {bat} km/h" if bat is not None else "Bat: --")
         self.overlay_arm.setText(f"Arm: {arm} km/h" if arm is not None else "Arm: --")
-        self.overlay_track.setText(f"TrackID: {data.get('track_id', '--')}")
+        self.overlay_track.setText(f"TrackID: {data.track_id}")
 
         # update right-hand metrics cards
-        mappings = {
-            "bat_speed": "bat_speed",
-            "arm_speed": "arm_speed",
-            "elbow": "elbow",
-            "knee": "knee",
-            "weight": "weight",
-            "track_id": "track_id"
-        }
-        for key, widget_key in mappings.items():
-            val = data.get(key, "--")
-            w = self.metric_widgets.get(widget_key)
-            if w:
-                w.setText(str(val))
-
-        # coach messaging (if enabled)
-        if self.chk_coach.isChecked() and data.get("feedback"):
-            msg = data.get("feedback")
-            # keep recent small history
-            if self.coach_list.count() > 20:
-                self.coach_list.takeItem(0)
-            self.coach_list.addItem(msg)
-            # also append to log
-            self.log(f"Coach: {msg}")
+        widgets = self.metric_widgets
+        widgets["bat_speed"].setText(str(bat))
+        widgets["arm_speed"].setText(str(arm))
+        widgets["elbow"].setText(str(data.elbow))
+        widgets["knee"].setText(str(data.knee))
+        widgets["weight"].setText(str(data.weight))
+        widgets["track_id"].setText(str(data.track_id))
+
+        # coach messaging (if enabled) — the QListWidget is rebuilt by a
+        # timer, not mutated per frame
+        if self.chk_coach.isChecked() and data.feedback:
+            msg = data.feedback
+            # steady-state clips repeat the same advice for many frames;
+            # only surface a message when it actually changes
+            if msg != self._last_coach_msg:
+                self._last_coach_msg = msg
+                self._coach_ring.append(msg)
+                self._coach_dirty = True
+                # also append to log
+                self.log(f"Coach: {msg}")
 
         # highlight created this frame?
-        highlight = data.get("highlight")
-        if highlight:
-            self.log(f"Saved highlight: {highlight}")
+        if data.highlight:
+            self.log(f"Saved highlight: {data.highlight}")
             # refresh thumbnails to include new highlight
             self.refresh_highlights()
 
+    def _apply_timeline_value(self):
+        if self._pending_timeline_val is None or self.timeline.isSliderDown():
+            return
+        # block signals while setting value to avoid triggering events
+        self.timeline.blockSignals(True)
+        self.timeline.setValue(self._pending_timeline_val)
+        self.timeline.blockSignals(False)
+        self._pending_timeline_val = None
+
     def on_seek(self):
         val = self.timeline.value()
         if self.worker:
@@ -597,6 +1093,8 @@ class CricketAIApp(QWidget):
             self.log(f"Seek to frame {val}")
 
     def on_finished(self):
+        self._display_timer.stop()
+        self._paint_latest()  # show the final frame
         self.log("Analysis finished")
         self.status_label.setText("Status: Idle")
         self.btn_start.setEnabled(True)
@@ -614,7 +1112,16 @@ class CricketAIApp(QWidget):
     # -------------------------
     # Highlights / thumbnails
     # -------------------------
-    def refresh_highlights(self):
+    def refresh_highlights(self, force=False):
+        # skip the rescan entirely when the directory is untouched
+        try:
+            dir_mtime = os.stat(self.highlights_dir).st_mtime_ns
+        except OSError:
+            dir_mtime = None
+        if not force and dir_mtime is not None and dir_mtime == self._highlights_mtime_ns:
+            return
+        self._highlights_mtime_ns = dir_mtime
+
         # clear grid
         while self.thumb_grid.count():
             item = self.thumb_grid.takeAt(0)
@@ -623,58 +1130,110 @@ class CricketAIApp(QWidget):
 
         files = []
         if os.path.exists(self.highlights_dir):
-            for f in sorted(os.listdir(self.highlights_dir), reverse=True):
-                if f.lower().endswith((".mp4", ".avi", ".mov")):
-                    files.append(os.path.join(self.highlights_dir, f))
-
-        # show up to 6 thumbnails
+            # scandir keeps the full path and a cached stat on each
+            # entry — no per-file join/stat round-trips
+            with os.scandir(self.highlights_dir) as it:
+                entries = [
+                    e for e in it
+                    if e.is_file() and e.name.rpartition(".")[2].lower() in HIGHLIGHT_EXTS
+                ]
+            entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+            files = [e.path for e in entries]
+
+        # show up to 6 thumbnails; cached thumbs load instantly, missing
+        # ones are generated in the thread pool and installed on signal
         max_show = 6
+        self._thumb_buttons = {}
         for idx, path in enumerate(files[:max_show]):
-            pix = qpixmap_from_image_path(path, max_size=(240, 140))
             btn = QPushButton()
             btn.setFixedSize(240, 140)
-            if pix:
-                btn.setIcon(QIcon(pix))
-                btn.setIconSize(QSize(240, 140))
-            else:
-                btn.setText(os.path.basename(path))
+            btn.setText(os.path.basename(path))
             btn.clicked.connect(partial(self.play_highlight, path))
             r = idx // 3
             c = idx % 3
             self.thumb_grid.addWidget(btn, r, c)
+            self._thumb_buttons[path] = btn
+
+            cache = thumb_cache_path(path)
+            # clips are overwritten in place between runs (shot ids
+            # restart at 1), so an existing thumb only counts when it
+            # is at least as new as the video it came from
+            try:
+                cache_fresh = os.path.getmtime(cache) >= os.path.getmtime(path)
+            except OSError:
+                cache_fresh = False
+            if cache_fresh:
+                self._install_thumbnail(path, cache)
+            else:
+                worker = ThumbnailWorker(path, cache)
+                worker.signals.done.connect(self._install_thumbnail)
+                self._thumb_pool.start(worker)
+
+    def _install_thumbnail(self, path, cache_path):
+        btn = self._thumb_buttons.get(path)
+        if btn is None:
+            return
+        pix = QPixmap(cache_path)
+        if pix.isNull():
+            return
+        btn.setText("")
+        btn.setIcon(QIcon(pix))
+        btn.setIconSize(QSize(240, 140))
 
     def play_highlight(self, path):
         if not os.path.exists(path):
             QMessageBox.warning(self, "Missing", "Highlight file not found")
             return
-        # Play in a lightweight modal-like loop (blocks, but small)
-        cap = cv2.VideoCapture(path)
-        if not cap.isOpened():
-            QMessageBox.warning(self, "Error", "Could not open highlight")
-            return
 
         self.log(f"Playing highlight: {os.path.basename(path)}")
-        while cap.isOpened():
-            ret, frame = cap.read()
-            if not ret:
-                break
-            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = rgb.shape
-            bytes_per_line = ch * w
-            img = QImage(rgb.data, w, h, bytes_per_line, QImage.Format_RGB888)
-            pix = QPixmap.fromImage(img)
-            self.video_label.setPixmap(pix.scaled(self.video_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation))
-            QApplication.processEvents()
-            # wait a bit: approximate 30fps playback
-            cv2.waitKey(int(1000 / 30))
-        cap.release()
+
+        if QMediaPlayer is None:
+            # no QtMultimedia: hand the file to the system player.
+            # argv-style Popen — no shell, so quotes in the filename
+            # can't break the command
+            try:
+                if sys.platform.startswith("win"):
+                    os.startfile(path)
+                elif sys.platform.startswith("darwin"):
+                    subprocess.Popen(["open", path])
+                else:
+                    subprocess.Popen(["xdg-open", path])
+            except Exception:
+                QMessageBox.warning(self, "Error", "Could not open highlight")
+            return
+
+        # QMediaPlayer uses the platform's hardware decoder and keeps
+        # the event loop free (no processEvents/waitKey pumping)
+        dialog = QDialog(self)
+        dialog.setWindowTitle(os.path.basename(path))
+        dialog.resize(860, 520)
+        layout = QVBoxLayout(dialog)
+        video_widget = QVideoWidget(dialog)
+        layout.addWidget(video_widget)
+
+        player = QMediaPlayer(dialog)
+        player.setVideoOutput(video_widget)
+        player.setMedia(QMediaContent(QUrl.fromLocalFile(os.path.abspath(path))))
+        player.mediaStatusChanged.connect(
+            lambda status: dialog.accept() if status == QMediaPlayer.EndOfMedia else None
+        )
+        player.play()
+        dialog.exec_()
+        player.stop()
         self.log("Highlight playback finished")
 
     # -------------------------
     # Logging helper
     # -------------------------
     def log(self, text):
-        self.log_box.append(text)
+        self._log_queue.append(text)
+
+    def _flush_log(self):
+        if not self._log_queue:
+            return
+        drained = "\n".join(self._log_queue)
+        self._log_queue.clear()
+        self.log_box.appendPlainText(drained)
 
     # -------------------------
     # Clean exit
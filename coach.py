@@ -12,6 +12,12 @@ class Coach:
         self.MIN_ELBOW_ANGLE = 120   # degrees
         self.MIN_KNEE_ANGLE = 140    # degrees
 
+        # memo of the last evaluation: inputs hold steady for many
+        # frames at a time, so unchanged metrics skip the rule ladder
+        # and return the same dict
+        self._last_inputs = None
+        self._last_result = None
+
     def evaluate(self, pose_data, speed_data):
         """
         Inputs:
@@ -31,41 +37,50 @@ class Coach:
         arm_speed = speed_data.get("arm_speed", 0)
         ball_speed = speed_data.get("ball_speed", 0)
 
+        inputs = (bat_speed, elbow, knee, arm_speed, ball_speed)
+        if inputs == self._last_inputs:
+            return self._last_result
+
         # ---------------- PRIORITY RULES ----------------
         # Order matters: most critical feedback first
 
         if bat_speed and bat_speed < self.MIN_BAT_SPEED:
-            return {
+            result = {
                 "feedback": "Increase bat swing speed for better power"
             }
 
-        if elbow and elbow < self.MIN_ELBOW_ANGLE:
-            return {
+        elif elbow and elbow < self.MIN_ELBOW_ANGLE:
+            result = {
                 "feedback": "Start downswing earlier – elbow collapsing"
             }
 
-        if knee and knee < self.MIN_KNEE_ANGLE:
-            return {
+        elif knee and knee < self.MIN_KNEE_ANGLE:
+            result = {
                 "feedback": "Bend front knee more for balance"
             }
 
-        if arm_speed and arm_speed < bat_speed * 0.6:
-            return {
+        elif arm_speed and arm_speed < bat_speed * 0.6:
+            result = {
                 "feedback": "Accelerate forearm more through contact"
             }
 
-        if ball_speed and ball_speed < bat_speed * 0.7:
-            return {
+        elif ball_speed and ball_speed < bat_speed * 0.7:
+            result = {
                 "feedback": "Late contact – meet the ball earlier"
             }
 
         # ---------------- POSITIVE FEEDBACK ----------------
-        if bat_speed >= 80 and elbow >= 140 and knee >= 150:
-            return {
+        elif bat_speed >= 80 and elbow >= 140 and knee >= 150:
+            result = {
                 "feedback": "Excellent shot mechanics 👍"
             }
 
         # ---------------- DEFAULT ----------------
-        return {
-            "feedback": "Good control – keep consistency"
-        }
+        else:
+            result = {
+                "feedback": "Good control – keep consistency"
+            }
+
+        self._last_inputs = inputs
+        self._last_result = result
+        return result
@@ -1,7 +1,13 @@
 import csv
 import os
+import queue
+import threading
+import time
 from datetime import datetime
 
+# close() marker for the writer thread
+_SENTINEL = object()
+
 
 class CSVLogger:
     """
@@ -16,14 +22,45 @@ class CSVLogger:
     Research / report ready.
     """
 
-    def __init__(self, filename="cricket_analysis.csv"):
+    def __init__(self, filename="cricket_analysis.csv", flush_every=0):
+        """
+        flush_every: flush to disk every N rows (0 = leave flushing
+        to the file buffer; close() always flushes).
+        """
         self.filename = filename
+        self.flush_every = flush_every
+        self._rows_since_flush = 0
+
+        # rows buffer in Python and hit the csv writer in batches,
+        # amortizing writerow dispatch and write() calls
+        self._row_buf = []
+        self._batch = 64
+
+        # the Timestamp column has second granularity, so the ISO
+        # string only changes once a second — cache it and rebuild on
+        # the tick instead of allocating a datetime per row
+        self._last_sec = 0
+        self._iso_cache = ""
+
         self._init_file()
 
+        # rows are handed to a background writer thread so disk latency
+        # never stalls the frame-processing path
+        self._q = queue.Queue(maxsize=256)
+        self._thread = threading.Thread(
+            target=self._writer_loop, daemon=True
+        )
+        self._thread.start()
+
     def _init_file(self):
         file_exists = os.path.exists(self.filename)
 
-        self.file = open(self.filename, "a", newline="", encoding="utf-8")
+        # large write buffer: rows are tiny, so let the buffer batch
+        # them instead of paying one write() syscall per frame
+        self.file = open(
+            self.filename, "a",
+            buffering=1 << 20, newline="", encoding="utf-8"
+        )
         self.writer = csv.writer(self.file)
 
         if not file_exists:
@@ -51,8 +88,13 @@ class CSVLogger:
             coach: dict from Coach
         """
 
+        now = int(time.time())
+        if now != self._last_sec:
+            self._last_sec = now
+            self._iso_cache = datetime.fromtimestamp(now).isoformat()
+
         row = [
-            datetime.now().isoformat(timespec="seconds"),
+            self._iso_cache,
             frame_id,
             shot.get("id", 0),
             shot.get("phase", "Idle"),
@@ -64,10 +106,66 @@ class CSVLogger:
             coach.get("feedback", "")
         ]
 
-        self.writer.writerow(row)
-        self.file.flush()  # ensure safety on crashes
+        try:
+            self._q.put_nowait(row)
+        except queue.Full:
+            # bounded queue: apply backpressure rather than drop rows
+            self._q.put(row)
+
+    def _writer_loop(self):
+        while True:
+            row = self._q.get()
+            if row is _SENTINEL:
+                break
+            self._row_buf.append(row)
+
+            # gather a batch while rows keep arriving; if the producer
+            # goes idle, write what we have instead of sitting on the
+            # tail of a run until the next full batch
+            closing = False
+            idle = False
+            while len(self._row_buf) < self._batch:
+                try:
+                    nxt = self._q.get(timeout=0.5)
+                except queue.Empty:
+                    idle = True
+                    break
+                if nxt is _SENTINEL:
+                    closing = True
+                    break
+                self._row_buf.append(nxt)
+
+            self._drain()
+            if idle:
+                # the run may just have ended — make the rows durable
+                self.file.flush()
+            if closing:
+                break
+
+    def _drain(self):
+        """Write any buffered rows in one writerows call."""
+        if not self._row_buf:
+            return
+        self.writer.writerows(self._row_buf)
+        if self.flush_every:
+            self._rows_since_flush += len(self._row_buf)
+            if self._rows_since_flush >= self.flush_every:
+                self.file.flush()
+                self._rows_since_flush = 0
+        self._row_buf.clear()
 
     def close(self):
+        try:
+            self._q.put(_SENTINEL)
+            self._thread.join(timeout=5)
+        except Exception:
+            pass
+        try:
+            self._drain()  # anything the writer thread left buffered
+            self.file.flush()
+            os.fsync(self.file.fileno())
+        except Exception:
+            pass
         try:
             self.file.close()
         except Exception:
@@ -1,4 +1,9 @@
+import queue
+import threading
 import time
+from collections import namedtuple
+
+import cv2
 
 from engine.pose_engine import PoseEngine
 from engine.shot_segmenter import ShotSegmenter
@@ -8,6 +13,24 @@ from engine.csv_logger import CSVLogger
 from engine.highlight_generator import HighlightGenerator
 
 
+# Per-frame UI payload. A namedtuple keeps the consumer side to one
+# tuple unpack / attribute read instead of a dict.get per field.
+Metrics = namedtuple("Metrics", [
+    "frame_id",
+    "shot",
+    "phase",
+    "track_id",
+    "weight",
+    "elbow",
+    "knee",
+    "bat_speed",
+    "ball_speed",
+    "arm_speed",
+    "feedback",
+    "highlight",
+])
+
+
 class CricketEngine:
     """
     Central orchestrator engine
@@ -25,6 +48,14 @@ class CricketEngine:
             output_dir=f"highlights/{self.video_name}"
         )
 
+        # hot-path methods prebound once: process_frame runs per frame
+        # and each self.x.y lookup there is two dict probes
+        self._pose = self.pose_engine.process
+        self._seg = self.segmenter.update
+        self._spd = self.speed.update
+        self._coach_eval = self.coach.evaluate
+        self._log = self.logger.write
+
         self.frame_id = 0
         self.start_time = time.time()
 
@@ -38,27 +69,33 @@ class CricketEngine:
         highlight_path = None
 
         # 1️⃣ Pose (Uses new Tracking Logic)
-        pose_data = self.pose_engine.process(frame)
+        pose_data = self._pose(frame)
 
         # 2️⃣ Shot segmentation
-        shot_data = self.segmenter.update(pose_data, frame_id)
+        shot_data = self._seg(pose_data, frame_id)
 
         # 3️⃣ Speed estimation
-        speed_data = self.speed.update(pose_data)
+        speed_data = self._spd(pose_data)
 
         # 4️⃣ Coaching feedback
-        coach_data = self.coach.evaluate(pose_data, speed_data)
+        coach_data = self._coach_eval(pose_data, speed_data)
 
-        # 5️⃣ Highlight generation (ONLY when shot ends)
-        if shot_data.get("ended"):
-            highlight_path = self.highlights.save(
+        # 5️⃣ Highlight generation (streamed frame-by-frame)
+        if shot_data.get("started"):
+            self.highlights.start(
                 shot_data["id"],
-                shot_data["frames"],
-                fps=pose_data.get("fps", 30)
+                fps=pose_data["fps"]
             )
+            # pre-trigger frames open the clip
+            for buffered in shot_data["frames"]:
+                self.highlights.write(buffered)
+        if shot_data.get("active"):
+            self.highlights.write(pose_data["annotated"])
+        if shot_data.get("ended"):
+            highlight_path = self.highlights.finish()
 
         # 6️⃣ CSV logging
-        self.logger.write(
+        self._log(
             frame_id=frame_id,
             timestamp=round(time.time() - self.start_time, 2),
             pose=pose_data,
@@ -68,15 +105,152 @@ class CricketEngine:
         )
 
         # 7️⃣ Data for UI
-        ui_data = {
-            "shot": shot_data.get("id", 0),
-            "phase": shot_data.get("phase", "Idle"),
-            "track_id": pose_data.get("track_id", "Search"),
-            "weight": pose_data.get("weight", "Neutral"),
-            **speed_data,
-            **coach_data,
-            "highlight": highlight_path
-        }
+        ui_data = Metrics(
+            frame_id=frame_id,
+            shot=shot_data.get("id", 0),
+            phase=shot_data.get("phase", "Idle"),
+            track_id=pose_data.get("track_id", "Search"),
+            weight=pose_data.get("weight", "Neutral"),
+            elbow=pose_data.get("elbow", 0),
+            knee=pose_data.get("knee", 0),
+            bat_speed=speed_data["bat_speed"],
+            ball_speed=speed_data["ball_speed"],
+            arm_speed=speed_data["arm_speed"],
+            feedback=coach_data.get("feedback", ""),
+            highlight=highlight_path
+        )
 
         self.frame_id += 1
-        return pose_data["annotated"], ui_data
\ No newline at end of file
+        return pose_data["annotated"], ui_data
+
+    # --------------------------------------------------
+    # SHUTDOWN
+    # --------------------------------------------------
+    def close(self):
+        """Flush the CSV log and wait for pending highlight encodes."""
+        self.logger.close()
+        self.highlights.close()
+
+    # --------------------------------------------------
+    # BATCH PROCESS
+    # --------------------------------------------------
+    def process_batch(self, frames, frame_ids=None):
+        """
+        Process a small tile of frames in order.
+
+        Tracking, shot segmentation and speed estimation are all
+        sequential state machines, so frames are still evaluated one
+        at a time — batching amortizes the per-call dispatch and queue
+        traffic of callers feeding frames through a pipeline.
+
+        frame_ids: optional per-frame ids matching `frames`; source
+        ids are not necessarily consecutive (the reader may skip
+        frames), so callers that know them should pass them through.
+
+        Returns a list of (annotated, ui_data) pairs, one per frame.
+        """
+        if frame_ids is None:
+            frame_ids = range(self.frame_id, self.frame_id + len(frames))
+
+        return [
+            self.process_frame(frame, fid)
+            for frame, fid in zip(frames, frame_ids)
+        ]
+
+    # --------------------------------------------------
+    # THREADED PIPELINE
+    # --------------------------------------------------
+    def run_video(self, source, sink=None, prefetch=4):
+        """
+        Run the full pipeline over a video headlessly.
+
+        Decode and output run on their own threads around this one:
+        a reader thread fills a bounded queue of frames, process_frame
+        runs here (pose/segmenter/speed are stateful and stay single-
+        threaded), and a writer thread drains results into `sink`.
+
+        Inputs:
+            source: anything cv2.VideoCapture accepts (path, index, URL)
+            sink: optional callable(annotated, metrics) invoked on the
+                  writer thread, e.g. for display or re-encoding
+            prefetch: bound for both queues
+
+        Returns the number of frames processed.
+        """
+        read_q = queue.Queue(maxsize=prefetch)
+        write_q = queue.Queue(maxsize=prefetch)
+
+        # set when any stage dies so the others stop instead of
+        # blocking forever on the bounded queues
+        stop = threading.Event()
+
+        def _put(q, item):
+            """Bounded put that gives up once the pipeline is stopping."""
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _reader():
+            cap = cv2.VideoCapture(source)
+            try:
+                while not stop.is_set() and cap.isOpened():
+                    ret, frame = cap.read()
+                    if not ret:
+                        break
+                    if not _put(read_q, frame):
+                        return
+            finally:
+                cap.release()
+                _put(read_q, None)
+
+        def _writer():
+            try:
+                while True:
+                    try:
+                        item = write_q.get(timeout=0.1)
+                    except queue.Empty:
+                        if stop.is_set():
+                            break
+                        continue
+                    if item is None:
+                        break
+                    if sink is not None:
+                        sink(*item)
+            finally:
+                # a sink exception must not strand the main loop in
+                # write_q.put()
+                stop.set()
+
+        reader = threading.Thread(target=_reader, daemon=True)
+        writer = threading.Thread(target=_writer, daemon=True)
+        reader.start()
+        writer.start()
+
+        processed = 0
+        try:
+            while True:
+                try:
+                    frame = read_q.get(timeout=0.1)
+                except queue.Empty:
+                    if stop.is_set():
+                        break
+                    continue
+                if frame is None:
+                    break
+                annotated, data = self.process_frame(frame)
+                if not _put(write_q, (annotated, data)):
+                    break
+                processed += 1
+        finally:
+            # let the writer drain before stopping it, then release
+            # the reader if it is still blocked on a full queue
+            _put(write_q, None)
+            stop.set()
+            writer.join()
+            reader.join()
+
+        return processed
\ No newline at end of file
@@ -1,25 +1,104 @@
-class HighlightGenerator:
-    def __init__(self, output_dir="highlights"):
-        self.output_dir = output_dir
-        os.makedirs(self.output_dir, exist_ok=True)
-def save(self, shot_id, frames, fps=30):
-    if not frames or len(frames) < 5:
-        return None
-
-    h, w, _ = frames[0].shape
-
-    filename = f"shot_{shot_id}.mp4"
-    path = os.path.join(self.output_dir, filename)
-
-    writer = cv2.VideoWriter(
-        path,
-        cv2.VideoWriter_fourcc(*"mp4v"),
-        fps,
-        (w, h)
-    )
-
-    for frame in frames:
-        writer.write(frame)
-
-    writer.release()
-    return path
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+
+
+class HighlightGenerator:
+    """
+    Streams shot frames into MP4 highlight clips.
+
+    A clip's VideoWriter is opened when the shot starts and frames are
+    encoded as they arrive, so peak memory is a handful of queued
+    frames instead of a whole buffered shot. Encoding runs on a
+    single-worker executor so the engine thread never blocks on
+    cv2.VideoWriter.
+    """
+
+    # clips shorter than this are noise, not shots
+    MIN_FRAMES = 5
+
+    def __init__(self, output_dir="highlights"):
+        self.output_dir = output_dir
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        # one worker keeps frames encoding in submission order; the
+        # writer state below is only ever touched from its tasks
+        self._encoder = ThreadPoolExecutor(max_workers=1)
+        self._writer = None
+        self._path = None
+        self._fps = 30
+        self._count = 0
+
+        # tracked on the caller's thread
+        self._pending_path = None
+        self._pending_count = 0
+
+    # --------------------------------------------------
+    # Caller-side API (engine thread)
+    # --------------------------------------------------
+    def start(self, shot_id, fps=30):
+        """Begin a new clip; frames follow via write()."""
+        path = os.path.join(self.output_dir, f"shot_{shot_id}.mp4")
+        self._pending_path = path
+        self._pending_count = 0
+        self._encoder.submit(self._open, path, fps)
+        return path
+
+    def write(self, frame):
+        """Queue one frame for the pending clip."""
+        # snapshot before queuing: the caller reuses its frame buffers
+        self._pending_count += 1
+        self._encoder.submit(self._write, frame.copy())
+
+    def finish(self):
+        """Close the pending clip; returns its path, or None if the
+        shot was too short to keep (the stub file is deleted)."""
+        path = self._pending_path
+        count = self._pending_count
+        self._pending_path = None
+        self._pending_count = 0
+        self._encoder.submit(self._close)
+        if count < self.MIN_FRAMES:
+            return None
+        return path
+
+    def close(self):
+        """Wait for any pending frames to finish encoding."""
+        self._encoder.submit(self._close)
+        self._encoder.shutdown(wait=True)
+
+    # --------------------------------------------------
+    # Encoder tasks (executor thread)
+    # --------------------------------------------------
+    def _open(self, path, fps):
+        self._path = path
+        self._fps = fps
+        self._writer = None  # opened lazily — needs the frame shape
+        self._count = 0
+
+    def _write(self, frame):
+        if self._path is None:
+            return
+        if self._writer is None:
+            h, w, _ = frame.shape
+            self._writer = cv2.VideoWriter(
+                self._path,
+                cv2.VideoWriter_fourcc(*"mp4v"),
+                self._fps,
+                (w, h)
+            )
+        self._writer.write(frame)
+        self._count += 1
+
+    def _close(self):
+        if self._writer is not None:
+            self._writer.release()
+            if self._count < self.MIN_FRAMES:
+                # too short to be a real shot — drop the stub file
+                try:
+                    os.remove(self._path)
+                except OSError:
+                    pass
+        self._writer = None
+        self._path = None
@@ -1,8 +1,57 @@
+import math
+import os
+
 import cv2
 import numpy as np
+import torch
 from ultralytics import YOLO
 
 
+def _angle(ax, ay, bx, by, cx, cy):
+    """Angle ABC in degrees from scalar coordinates.
+
+    Plain float math — no ndarray temporaries, no np.linalg.norm — is
+    an order of magnitude cheaper for 2D vectors at per-frame rates.
+    """
+    bax = ax - bx
+    bay = ay - by
+    bcx = cx - bx
+    bcy = cy - by
+    denom = math.hypot(bax, bay) * math.hypot(bcx, bcy)
+    if denom == 0.0:
+        return 0
+    cos = (bax * bcx + bay * bcy) / denom
+    cos = -1.0 if cos < -1.0 else (1.0 if cos > 1.0 else cos)
+    return int(math.degrees(math.acos(cos)))
+
+
+# Model weights in preference order, fastest runtime first. Exported
+# files (see PoseEngine.export_optimized) sit next to the .pt and are
+# picked up automatically on the next start.
+_MODEL_CANDIDATES = (
+    "yolov8n-pose.engine",   # TensorRT plan (FP16/INT8)
+    "yolov8n-pose.onnx",     # ONNX Runtime
+    "yolov8n-pose.pt",       # PyTorch baseline
+)
+
+
+def _pick_model():
+    for name in _MODEL_CANDIDATES:
+        if os.path.exists(name):
+            return name
+    return _MODEL_CANDIDATES[-1]
+
+
+def _pick_device():
+    """Best available inference device: CUDA > Apple MPS > CPU."""
+    if torch.cuda.is_available():
+        return 0
+    mps = getattr(torch.backends, "mps", None)
+    if mps is not None and mps.is_available():
+        return "mps"
+    return "cpu"
+
+
 class PoseEngine:
     """
     Handles:
@@ -12,102 +61,248 @@ class PoseEngine:
     - Biomechanical analysis (Angles + Weight Transfer)
     """
 
+    # Biomechanics keypoints in YOLOv8 ordering: R shoulder, R elbow,
+    # R wrist, R hip, R knee, R ankle. One fancy index with this array
+    # replaces six per-frame row slices.
+    _KP_IDX = np.array([6, 8, 10, 12, 14, 16], dtype=np.int64)
+
+    # Weight-transfer keypoints: L hip, R hip, L ankle, R ankle
+    _WT_IDX = np.array([11, 12, 15, 16], dtype=np.int64)
+
     def __init__(self):
-        # Using yolov8n-pose for speed; persist=True is key for tracking
-        self.model = YOLO("yolov8n-pose.pt")
+        # Using yolov8n-pose for speed; persist=True is key for tracking.
+        # Prefers a quantized/exported variant when one has been built.
+        self.model = YOLO(_pick_model())
+        # Pose inference is the dominant per-frame cost — run it on the
+        # GPU whenever one is available instead of defaulting to CPU
+        self.device = _pick_device()
         self.target_id = None  # The ID we want to analyze specifically
-        self.fps = 30 
+        self.fps = 30
+
+        # track() arguments are fixed per session — build them once.
+        # classes=[0] restricts detection to persons; FP16 halves
+        # inference bandwidth on CUDA.
+        self._track_kwargs = {
+            "persist": True,
+            "verbose": False,
+            "device": self.device,
+            "classes": [0],
+        }
+        if self.device == 0:
+            self._track_kwargs["half"] = True
+            # inference sizes are fixed per session, so let cuDNN
+            # autotune its kernels once and reuse them
+            torch.backends.cudnn.benchmark = True
+
+        # Ultralytics owns preprocessing and the H2D upload inside
+        # track(), so frames can't be staged through a caller-side
+        # pinned buffer. Pay the one-off costs (CUDA context, kernel
+        # selection, allocator growth) on a dummy frame here instead
+        # of on the first real frame.
+        self.model.predict(
+            np.zeros((384, 640, 3), dtype=np.uint8),
+            device=self.device,
+            verbose=False,
+        )
+
+        # ROI tracking: once the target is stable, inference and the
+        # frame-diff only see a padded crop around it. A full-frame
+        # pass every N frames catches new or re-entering subjects.
+        self.roi = None
+        self.roi_pad = 80
+        self.roi_imgsz = 416
+        self.full_redetect_every = 30
+        self._frames_since_full = 0
+
+        # Temporal subsampling: run YOLO on every Nth frame and reuse
+        # the previous keypoints in between — joint angles change
+        # slowly relative to a 30 FPS stream. 1 disables skipping.
+        self.infer_every = 2
+        self._skip_count = 0
+        self._last_data = None
+        self._last_boxes = None
+        self._last_ids = None
+
+    @staticmethod
+    def export_optimized(fmt="onnx", imgsz=640, **kwargs):
+        """
+        One-time export of the pose model to a faster runtime.
+
+        fmt="engine" builds a TensorRT plan (pass half=True for FP16,
+        or int8=True plus calibration data= for INT8); fmt="onnx"
+        writes an ONNX graph for ONNX Runtime / OpenVINO. The exported
+        file lands next to the .pt and is preferred automatically the
+        next time PoseEngine starts.
+        """
+        model = YOLO("yolov8n-pose.pt")
+        return model.export(format=fmt, imgsz=imgsz, dynamic=False, **kwargs)
 
     @staticmethod
     def calculate_angle(a, b, c):
         """Calculates angle between three points (a, b, c)."""
-        a, b, c = np.array(a), np.array(b), np.array(c)
-        ba = a - b
-        bc = c - b
-        cos = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc))
-        angle = np.degrees(np.arccos(np.clip(cos, -1.0, 1.0)))
-        return int(angle)
+        return _angle(a[0], a[1], b[0], b[1], c[0], c[1])
 
     def calculate_weight_transfer(self, kpts):
         """
         Estimates weight distribution based on Hip x-position relative to Ankles.
         Returns: string (e.g., "60% Front", "Balanced")
         """
-        try:
-            # YOLOv8 Indices: 11: L Hip, 12: R Hip, 15: L Ankle, 16: R Ankle
-            l_hip, r_hip = kpts[11][:2], kpts[12][:2]
-            l_ankle, r_ankle = kpts[15][:2], kpts[16][:2]
-
-            # Hip Midpoint (Approximation of Center of Mass)
-            hip_center_x = (l_hip[0] + r_hip[0]) / 2
-            
-            feet_width = abs(l_ankle[0] - r_ankle[0])
-            if feet_width < 10: return "Balanced"
-
-            # Determine bounds
-            min_x = min(l_ankle[0], r_ankle[0])
-            max_x = max(l_ankle[0], r_ankle[0])
-            
-            # Position as a percentage (0 = Back Foot, 1 = Front Foot)
-            pos_ratio = (hip_center_x - min_x) / (max_x - min_x)
-            pos_ratio = np.clip(pos_ratio, 0, 1)
-
-            # Map to text
-            if pos_ratio > 0.6:
-                return f"{int(pos_ratio * 100)}% Front"
-            elif pos_ratio < 0.4:
-                return f"{int((1 - pos_ratio) * 100)}% Back"
-            else:
-                return "Balanced"
-        except:
+        # Explicit checks instead of a bare try/except: the only
+        # legitimate failures are a short keypoint array or joints the
+        # model didn't see (keypoints.xy reports those as x == 0)
+        if kpts.shape[0] < 17:
+            return "Neutral"
+
+        # only the x coordinates matter — one gather, four floats
+        l_hip_x, r_hip_x, l_ankle_x, r_ankle_x = kpts[self._WT_IDX, 0]
+        if l_hip_x == 0 or r_hip_x == 0 or l_ankle_x == 0 or r_ankle_x == 0:
             return "Neutral"
 
+        feet_width = abs(l_ankle_x - r_ankle_x)
+        if feet_width < 10:
+            return "Balanced"
+
+        # Hip Midpoint (Approximation of Center of Mass)
+        hip_center_x = (l_hip_x + r_hip_x) / 2
+
+        # Determine bounds
+        if l_ankle_x < r_ankle_x:
+            min_x, max_x = l_ankle_x, r_ankle_x
+        else:
+            min_x, max_x = r_ankle_x, l_ankle_x
+
+        # Position as a percentage (0 = Back Foot, 1 = Front Foot)
+        pos_ratio = (hip_center_x - min_x) / (max_x - min_x)
+        pos_ratio = max(0.0, min(1.0, pos_ratio))
+
+        # Map to text
+        if pos_ratio > 0.6:
+            return f"{int(pos_ratio * 100)}% Front"
+        elif pos_ratio < 0.4:
+            return f"{int((1 - pos_ratio) * 100)}% Back"
+        else:
+            return "Balanced"
+
+    def _draw_ids(self, annotated, boxes, track_ids):
+        for i, tid in enumerate(track_ids):
+            x1, y1, x2, y2 = map(int, boxes[i])
+
+            # Color coding: Green if it's our target, Orange otherwise
+            color = (0, 255, 0) if (self.target_id is not None and tid == self.target_id) else (0, 165, 255)
+
+            label = f"ID: {tid}"
+            cv2.putText(
+                annotated, label, (x1, y1 - 10),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2
+            )
+            cv2.rectangle(annotated, (x1, y1), (x2, y2), color, 2)
+
+    def _reuse_last(self, frame):
+        """Serve an in-between frame from the previous inference."""
+        data = dict(self._last_data)
+        data["annotated"] = frame
+        data["inferred"] = False
+
+        # the frame-diff still sees the current frame's pixels
+        data["gray_fn"] = lambda: cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+
+        # redraw the cached detections so the overlay doesn't flicker
+        if self._last_boxes is not None:
+            self._draw_ids(frame, self._last_boxes, self._last_ids)
+        return data
+
     def process(self, frame):
         """
         Process frame to track subjects and extract data for the target.
         """
-        annotated = frame.copy()
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        # every-Nth-frame inference: serve the in-between frames from
+        # the cached detection
+        if self._last_data is not None and self._skip_count < self.infer_every - 1:
+            self._skip_count += 1
+            return self._reuse_last(frame)
+        self._skip_count = 0
+
+        # Draw directly on the caller's frame: the pipeline hands each
+        # frame to the engine exactly once, so the defensive full-frame
+        # copy was pure memory traffic.
+        annotated = frame
+
+        # ---------------- 0. ROI SELECTION ----------------
+        # After the first stable detection, run inference on a padded
+        # crop around the target instead of the full frame
+        off_x = off_y = 0
+        roi = self.roi
+        if roi is not None:
+            self._frames_since_full += 1
+            if self._frames_since_full >= self.full_redetect_every:
+                # periodic full-frame pass to catch new subjects
+                roi = None
+                self._frames_since_full = 0
+
+        if roi is not None:
+            rx1, ry1, rx2, ry2 = roi
+            infer_frame = frame[ry1:ry2, rx1:rx2]
+            if infer_frame.size:
+                off_x, off_y = rx1, ry1
+            else:
+                infer_frame = frame
+                roi = None
+        else:
+            infer_frame = frame
 
         data = {
             "annotated": annotated,
-            "gray": gray,
+            # grayscale is only needed by the ball-speed estimator, so
+            # defer the BGR->GRAY pass until something asks for it.
+            # Always the full frame: the ROI crop's shape and origin
+            # follow the tracked box, so diffing crops would compare
+            # misaligned regions — and the ball spends most of its
+            # flight outside the batter's box anyway.
+            "gray_fn": lambda: cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY),
             "elbow": 0,
             "knee": 0,
             "weight": "Neutral",
             "wrist": None,
             "elbow_pt": None,
             "track_id": "Searching...",
-            "fps": self.fps
+            "fps": self.fps,
+            "inferred": True,
+            "infer_interval": self.infer_every
         }
 
         # Enable tracking with persist=True to keep IDs consistent
         # NOTE: Requires 'pip install lapx'
-        results = self.model.track(frame, persist=True, verbose=False)
+        if roi is not None:
+            results = self.model.track(infer_frame, imgsz=self.roi_imgsz, **self._track_kwargs)
+        else:
+            results = self.model.track(infer_frame, **self._track_kwargs)
 
         # Check if we have detections
-        if (not results or results[0].boxes is None or 
+        if (not results or results[0].boxes is None or
             results[0].boxes.id is None or len(results[0].boxes) == 0):
+            self.roi = None  # lost the target: next frame is full-frame
+            self._last_boxes = None
+            self._last_ids = None
+            self._last_data = data
             return data
 
-        boxes = results[0].boxes.xyxy.cpu().numpy()
-        track_ids = results[0].boxes.id.int().cpu().numpy()
-        kpts_all = results[0].keypoints.xy.cpu().numpy()
+        # boxes + ids come down once for the visualizer; keypoints stay
+        # on-device until the target is chosen, so only one person's
+        # 17x2 slice crosses the device boundary
+        res = results[0]
+        boxes = res.boxes.xyxy.cpu().numpy()
+        track_ids = res.boxes.id.int().cpu().numpy()
+
+        # translate crop-space boxes back into frame coordinates
+        if off_x or off_y:
+            boxes[:, [0, 2]] += off_x
+            boxes[:, [1, 3]] += off_y
 
         # ---------------- 1. VISUALIZE TRACK IDs ----------------
         # Draw IDs on everyone so the user can see them
-        for i, tid in enumerate(track_ids):
-            x1, y1, x2, y2 = map(int, boxes[i])
-            
-            # Color coding: Green if it's our target, Orange otherwise
-            color = (0, 255, 0) if (self.target_id is not None and tid == self.target_id) else (0, 165, 255)
-            
-            label = f"ID: {tid}"
-            cv2.putText(
-                annotated, label, (x1, y1 - 10),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.7, color, 2
-            )
-            cv2.rectangle(annotated, (x1, y1), (x2, y2), color, 2)
+        self._draw_ids(annotated, boxes, track_ids)
+        self._last_boxes = boxes
+        self._last_ids = track_ids
 
         # ---------------- 2. SELECT TARGET ----------------
         target_idx = None
@@ -129,16 +324,43 @@ class PoseEngine:
                     current_track_id = track_ids[i]
 
         # ---------------- 3. EXTRACT METRICS ----------------
-        if target_idx is not None:
-            kpts = kpts_all[target_idx]
+        if target_idx is None:
+            self.roi = None
+        else:
+            # follow the target with a padded ROI for the next frame
+            fh, fw = frame.shape[:2]
+            bx1, by1, bx2, by2 = boxes[target_idx]
+            pad = self.roi_pad
+            self.roi = (
+                max(0, int(bx1) - pad),
+                max(0, int(by1) - pad),
+                min(fw, int(bx2) + pad),
+                min(fh, int(by2) + pad),
+            )
+
+            kpts = res.keypoints.xy[target_idx].cpu().numpy()
+            if off_x or off_y:
+                # undetected joints are reported at (0, 0) and
+                # calculate_weight_transfer relies on that — translate
+                # only the detected rows so the invariant holds
+                detected = (kpts[:, 0] != 0) | (kpts[:, 1] != 0)
+                kpts[detected, 0] += off_x
+                kpts[detected, 1] += off_y
             try:
-                # Calculate Biomechanics
-                elbow_angle = self.calculate_angle(kpts[6][:2], kpts[8][:2], kpts[10][:2])
-                knee_angle = self.calculate_angle(kpts[12][:2], kpts[14][:2], kpts[16][:2])
+                # one gather for all biomechanics keypoints
+                sel = kpts[self._KP_IDX]
+
+                # Calculate Biomechanics (scalar math, no slicing temps)
+                elbow_angle = _angle(sel[0][0], sel[0][1],
+                                     sel[1][0], sel[1][1],
+                                     sel[2][0], sel[2][1])
+                knee_angle = _angle(sel[3][0], sel[3][1],
+                                    sel[4][0], sel[4][1],
+                                    sel[5][0], sel[5][1])
                 weight_str = self.calculate_weight_transfer(kpts)
 
-                wrist = tuple(kpts[10][:2].astype(int))
-                elbow_pt = tuple(kpts[8][:2].astype(int))
+                # wrist + elbow points in one batched cast
+                wrist, elbow_pt = map(tuple, sel[[2, 1]].astype(np.int32).tolist())
 
                 data.update({
                     "annotated": annotated, # Contains the ID drawings
@@ -153,4 +375,5 @@ class PoseEngine:
                 # Fallback if keypoints are obscured
                 pass
 
+        self._last_data = data
         return data
\ No newline at end of file
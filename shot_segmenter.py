@@ -1,37 +1,72 @@
 from collections import deque
 
+import numpy as np
+
+
+# Integer phase codes — the per-frame hot path compares and stores
+# ints; names are looked up once per frame from this tuple.
+_BACKLIFT, _DOWNSWING, _CONTACT, _FOLLOWTHROUGH = range(4)
+_PHASE_NAMES = ("Backlift", "Downswing", "Contact", "FollowThrough")
+
+
+def _phase_code(elbow_angle):
+    """Map an elbow angle to a phase code (0..3)."""
+    if elbow_angle > 150:
+        return _BACKLIFT
+    if elbow_angle > 120:
+        return _DOWNSWING
+    if elbow_angle > 90:
+        return _CONTACT
+    return _FOLLOWTHROUGH
+
 
 class ShotSegmenter:
     """
     Responsible for:
     - Detecting shot phases
     - Segmenting shots
-    - Buffering frames for highlights
+    - Keeping a short pre-trigger ring so clips start just before
+      the backlift is detected
 
-    Stateless with respect to pose detection.
+    Stateless with respect to pose detection. Frames inside an active
+    shot stream straight to the highlight writer (see CricketEngine),
+    so only `pre_trigger` raw frames are ever held here.
     """
 
-    def __init__(self, buffer_size=120):
+    def __init__(self, pre_trigger=10):
         """
-        buffer_size: max frames stored per shot
+        pre_trigger: frames kept from before a shot starts
         """
-        self.current_shot = None
+        # Shot state as plain ints: 0 = no active shot. Avoids a dict
+        # build/teardown per shot and dict lookups per frame.
+        self.active_shot = 0
         self.shot_id = 0
-        self.frame_buffer = deque(maxlen=buffer_size)
+        self.pre_trigger = pre_trigger
+
+        # Preallocated ring of reusable frame buffers (lazily sized on
+        # the first frame). The deque stores ring indices, so buffering
+        # a frame is one np.copyto — no per-frame allocation.
+        self._pool = None
+        self._ring_idx = 0
+        self.frame_buffer = deque(maxlen=pre_trigger)
+
+    def _store_frame(self, frame):
+        """Copy `frame` into the next pool slot and remember its index."""
+        if self._pool is None or self._pool[0].shape != frame.shape:
+            self._pool = [np.empty_like(frame) for _ in range(self.pre_trigger)]
+            self._ring_idx = 0
+            self.frame_buffer.clear()
+        idx = self._ring_idx
+        np.copyto(self._pool[idx], frame)
+        self._ring_idx = (idx + 1) % self.pre_trigger
+        self.frame_buffer.append(idx)
 
     # --------------------------------------------------
     # Phase logic (rule-based)
     # --------------------------------------------------
     @staticmethod
     def detect_phase(elbow_angle):
-        if elbow_angle > 150:
-            return "Backlift"
-        elif elbow_angle > 120:
-            return "Downswing"
-        elif elbow_angle > 90:
-            return "Contact"
-        else:
-            return "FollowThrough"
+        return _PHASE_NAMES[_phase_code(elbow_angle)]
 
     # --------------------------------------------------
     # Main update
@@ -48,52 +83,45 @@ class ShotSegmenter:
               "id": int,
               "phase": str,
               "started": bool,
+              "active": bool,
               "ended": bool,
-              "frames": list (only when ended)
+              "frames": list (pre-trigger frames, only when started)
             }
         """
 
-        elbow = pose_data.get("elbow", 0)
-        frame = pose_data.get("annotated")
+        # Hot path works on int phase codes and int shot state; both
+        # keys are always present in PoseEngine's output
+        code = _phase_code(pose_data["elbow"])
+        active = self.active_shot
 
-        phase = self.detect_phase(elbow)
-
-        # Default return
-        result = {
-            "id": self.shot_id,
-            "phase": phase,
-            "started": False,
-            "ended": False,
-            "frames": None
-        }
+        started = False
+        ended = False
+        frames = None
 
         # ---------------- Start Shot ----------------
-        if phase == "Backlift" and self.current_shot is None:
+        if code == _BACKLIFT and active == 0:
             self.shot_id += 1
-            self.current_shot = {
-                "id": self.shot_id,
-                "start_frame": frame_id
-            }
+            active = self.active_shot = self.shot_id
+            started = True
+            # hand over the pre-trigger frames for the clip opening;
+            # the pool is only reused once the shot is over
+            frames = [self._pool[i] for i in self.frame_buffer]
             self.frame_buffer.clear()
-            result["started"] = True
 
-        # ---------------- Buffer Frames ----------------
-        if self.current_shot is not None:
-            self.frame_buffer.append(frame.copy())
+        # ---------------- Pre-trigger ring ----------------
+        if active == 0:
+            self._store_frame(pose_data["annotated"])
 
         # ---------------- End Shot ----------------
-        if phase == "FollowThrough" and self.current_shot is not None:
-            result.update({
-                "id": self.current_shot["id"],
-                "ended": True,
-                "frames": list(self.frame_buffer)
-            })
-
-            self.current_shot = None
-            self.frame_buffer.clear()
-
-        # Active shot ID
-        if self.current_shot:
-            result["id"] = self.current_shot["id"]
-
-        return result
+        if code == _FOLLOWTHROUGH and active:
+            ended = True
+            self.active_shot = 0
+
+        return {
+            "id": active if active else self.shot_id,
+            "phase": _PHASE_NAMES[code],
+            "started": started,
+            "active": active != 0,
+            "ended": ended,
+            "frames": frames
+        }
@@ -1,3 +1,5 @@
+import math
+
 import cv2
 import numpy as np
 from collections import deque
@@ -25,20 +27,47 @@ class SpeedEstimator:
         self.prev_ball_center = None
         self.ball_speeds = deque(maxlen=5)
 
+        # scratch buffers reused across frames via cv2's dst= argument
+        # (lazily sized to the incoming gray frame)
+        self._diff = None
+        self._thresh = None
+
+        # OpenCL T-API path: absdiff/threshold/medianBlur are memory-
+        # bandwidth-bound and offload well to an integrated GPU that
+        # would otherwise sit idle next to the pose model. Falls back
+        # to the CPU scratch buffers when no OpenCL device exists.
+        self._use_ocl = cv2.ocl.haveOpenCL()
+        if self._use_ocl:
+            cv2.ocl.setUseOpenCL(True)
+        self._prev_umat = None
+        self._prev_shape = None
+
+        # last emitted speeds, reused on frames where the pose engine
+        # served cached keypoints (temporal subsampling)
+        self._last_speeds = {
+            "bat_speed": 0.0,
+            "ball_speed": 0.0,
+            "arm_speed": 0.0
+        }
+
     # --------------------------------------------------
     # BAT SPEED (wrist-based, smoothed)
     # --------------------------------------------------
-    def _bat_speed(self, wrist):
+    def _bat_speed(self, wrist, interval=1):
         if wrist is None or self.prev_wrist is None:
             self.prev_wrist = wrist
             return 0.0
 
-        px_dist = np.linalg.norm(
-            np.array(wrist) - np.array(self.prev_wrist)
+        # scalar 2D distance — math.hypot is one C call, no ndarray
+        # temporaries for two floats
+        px_dist = math.hypot(
+            wrist[0] - self.prev_wrist[0],
+            wrist[1] - self.prev_wrist[1]
         )
         self.prev_wrist = wrist
 
-        raw_speed = px_dist * self.meters_per_pixel * self.fps * 3.6
+        # `interval` frames elapsed between keypoint updates
+        raw_speed = px_dist * self.meters_per_pixel * (self.fps / interval) * 3.6
 
         # EMA smoothing
         if self.bat_ema is None:
@@ -55,46 +84,92 @@ class SpeedEstimator:
     # --------------------------------------------------
     # BALL SPEED (motion-based)
     # --------------------------------------------------
-    def _ball_speed(self, gray):
-        if self.prev_gray is None:
+    def _motion_mask(self, gray):
+        """Thresholded frame-diff mask (CPU path), or None if quiet."""
+        # frames are full-size and frame-anchored; a shape change only
+        # happens on a source switch, so it just reseeds the reference
+        if self.prev_gray is None or self.prev_gray.shape != gray.shape:
             self.prev_gray = gray
-            return 0.0
+            self.prev_ball_center = None
+            return None
+
+        if self._diff is None or self._diff.shape != gray.shape:
+            self._diff = np.empty_like(gray)
+            self._thresh = np.empty_like(gray)
 
-        # Frame differencing
-        diff = cv2.absdiff(self.prev_gray, gray)
+        # Frame differencing — dst= writes into the reused buffers
+        # instead of allocating new frame-sized arrays each call
+        cv2.absdiff(self.prev_gray, gray, dst=self._diff)
         self.prev_gray = gray
 
+        cv2.threshold(self._diff, 25, 255, cv2.THRESH_BINARY, dst=self._thresh)
+
+        # nothing moved: skip the blur and the component pass outright
+        if cv2.countNonZero(self._thresh) < 5:
+            return None
+
+        cv2.medianBlur(self._thresh, 5, dst=self._thresh)
+        return self._thresh
+
+    def _motion_mask_ocl(self, gray):
+        """Same mask via cv2.UMat so the filtering runs on OpenCL."""
+        u = cv2.UMat(gray)
+        if self._prev_umat is None or self._prev_shape != gray.shape:
+            self._prev_umat = u
+            self._prev_shape = gray.shape
+            self.prev_ball_center = None
+            return None
+
+        diff = cv2.absdiff(self._prev_umat, u)
+        self._prev_umat = u
+
         _, thresh = cv2.threshold(diff, 25, 255, cv2.THRESH_BINARY)
+        if cv2.countNonZero(thresh) < 5:
+            return None
+
         thresh = cv2.medianBlur(thresh, 5)
+        # connectedComponentsWithStats has no OpenCL kernel — download
+        # only the final binary mask
+        return thresh.get()
+
+    def _ball_speed(self, gray, interval=1):
+        mask = (self._motion_mask_ocl(gray) if self._use_ocl
+                else self._motion_mask(gray))
+        if mask is None:
+            return 0.0
 
-        contours, _ = cv2.findContours(
-            thresh, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE
+        # one labelling pass yields areas and bounding boxes directly —
+        # no contour list allocation, no Python max() over contours
+        num, _, stats, _ = cv2.connectedComponentsWithStats(
+            mask, connectivity=8
         )
-
-        if not contours:
+        if num <= 1:  # label 0 is background
             return 0.0
 
-        # Choose small fast-moving object
-        c = max(contours, key=cv2.contourArea)
-        area = cv2.contourArea(c)
-
-        # Filter noise (cricket ball size range)
-        if area < 5 or area > 300:
+        # Choose small fast-moving object (cricket ball size range)
+        areas = stats[1:, cv2.CC_STAT_AREA]
+        in_range = (areas >= 5) & (areas <= 300)
+        if not in_range.any():
             return 0.0
 
-        x, y, w, h = cv2.boundingRect(c)
-        center = (x + w // 2, y + h // 2)
+        candidates = np.flatnonzero(in_range)
+        best = stats[1 + candidates[np.argmax(areas[candidates])]]
+        center = (
+            best[cv2.CC_STAT_LEFT] + best[cv2.CC_STAT_WIDTH] // 2,
+            best[cv2.CC_STAT_TOP] + best[cv2.CC_STAT_HEIGHT] // 2,
+        )
 
         if self.prev_ball_center is None:
             self.prev_ball_center = center
             return 0.0
 
-        px_dist = np.linalg.norm(
-            np.array(center) - np.array(self.prev_ball_center)
+        px_dist = math.hypot(
+            center[0] - self.prev_ball_center[0],
+            center[1] - self.prev_ball_center[1]
         )
         self.prev_ball_center = center
 
-        speed = px_dist * self.meters_per_pixel * self.fps * 3.6
+        speed = px_dist * self.meters_per_pixel * (self.fps / interval) * 3.6
         self.ball_speeds.append(speed)
 
         return round(min(np.mean(self.ball_speeds), 160.0), 2)
@@ -103,14 +178,25 @@ class SpeedEstimator:
     # MAIN UPDATE (called from engine)
     # --------------------------------------------------
     def update(self, pose_data):
-        bat_speed = self._bat_speed(pose_data.get("wrist"))
-        ball_speed = self._ball_speed(pose_data.get("gray"))
+        # Skipped frames carry the previous keypoints verbatim — the
+        # wrist hasn't "moved", so re-deriving speeds would read zero.
+        # Hold the last real estimate until the next inference frame.
+        if not pose_data.get("inferred", True):
+            return self._last_speeds
+
+        interval = pose_data.get("infer_interval", 1)
+        bat_speed = self._bat_speed(pose_data.get("wrist"), interval)
+
+        # grayscale is produced lazily by PoseEngine
+        gray_fn = pose_data.get("gray_fn")
+        ball_speed = self._ball_speed(gray_fn(), interval) if gray_fn is not None else 0.0
 
         # Arm speed approx ratio (biomechanics heuristic)
         arm_speed = round(bat_speed * 0.6, 2)
 
-        return {
+        self._last_speeds = {
             "bat_speed": bat_speed,
             "ball_speed": ball_speed,
             "arm_speed": arm_speed
         }
+        return self._last_speeds